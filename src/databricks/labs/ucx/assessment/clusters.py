@@ -1,10 +1,16 @@
-import base64
+import binascii
+import functools
 import json
 import logging
-from collections.abc import Iterable
+import re
+import threading
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
-from typing import ClassVar
+from itertools import islice
+from operator import itemgetter
+from typing import ClassVar, TypeVar
 
+from databricks.labs.blueprint.parallel import Threads
 from databricks.labs.lsql.backends import SqlBackend
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.errors import NotFound, BadRequest
@@ -12,11 +18,8 @@ from databricks.sdk.service.compute import (
     ClusterDetails,
     ClusterSource,
     DataSecurityMode,
-    DbfsStorageInfo,
     InitScriptInfo,
-    LocalFileInfo,
     Policy,
-    WorkspaceStorageInfo,
 )
 
 from databricks.labs.ucx.assessment.crawlers import (
@@ -35,8 +38,61 @@ from databricks.labs.ucx.framework.utils import escape_sql_identifier
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of bytes returned by a single DBFS read
+DBFS_READ_CHUNK_SIZE = 1024 * 1024
+# Number of listed items that are assessed before the listing is consumed further
+ASSESSMENT_BATCH_SIZE = 500
+
+_DBFS_MOUNT_PATTERN = re.compile(r"(?:dbfs:|/dbfs)/mnt")
+_SKIPPED_CLUSTER_SOURCES = frozenset({ClusterSource.JOB})
+_UNSUPPORTED_DATA_SECURITY_MODES = frozenset(
+    {
+        DataSecurityMode.LEGACY_PASSTHROUGH,
+        DataSecurityMode.LEGACY_SINGLE_USER,
+        DataSecurityMode.LEGACY_TABLE_ACL,
+    }
+)
+
+
+def _decode_base64(data: str | None) -> bytes:
+    """Decode base64-encoded content, as returned by the DBFS and workspace APIs."""
+    if not data:
+        return b""
+    return binascii.a2b_base64(data)
+
+
+@functools.lru_cache(maxsize=128)
+def _spark_version_info(spark_version: str | None) -> tuple[str, bool]:
+    """The compatibility of a runtime version and whether it is a machine learning runtime.
+
+    Most clusters share a handful of runtime versions, so the parsing is done once per distinct version.
+    """
+    return spark_version_compatibility(spark_version), is_mlr(spark_version)
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _assess_concurrently(name: str, assess: Callable[[T], R], items: Iterable[T], batch_size: int) -> Iterator[R]:
+    """Lazily assess the items in parallel, keeping the order of the items.
+
+    The items are consumed in batches, so that only a batch of items and results is held in memory at a time.
+    """
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        tasks = []
+        for position, item in enumerate(batch):
+            tasks.append(functools.partial(_assess_at, position, assess, item))
+        for _, result in sorted(Threads.strict(name, tasks), key=itemgetter(0)):
+            yield result
 
-@dataclass
+
+def _assess_at(position: int, assess: Callable[[T], R], item: T) -> tuple[int, R]:
+    return position, assess(item)
+
+
+@dataclass(slots=True)
 class ClusterInfo:
     cluster_id: str
     success: int
@@ -62,128 +118,236 @@ class ClusterInfo:
         )
 
 
-class CheckClusterMixin(CheckInitScriptMixin):
-    _ws: WorkspaceClient
+# A cluster policy with its parsed definition and policy family definition overrides
+ParsedPolicy = tuple[Policy, dict | None, dict | None]
+
+
+class PolicyRegistry:
+    """The cluster policies of a workspace, with their parsed definitions, for the duration of a crawl.
 
-    def _safe_get_cluster_policy(self, policy_id: str) -> Policy | None:
+    The policies are listed once, on first use, and listed again after a reset. Policies missing from the listing are fetched individually, and
+    deleted policies are remembered as such, so that every policy is parsed once. The lock guards the listing and the
+    cache, but is not held while fetching individual policies.
+    """
+
+    def __init__(self, ws: WorkspaceClient):
+        self._ws = ws
+        self._lock = threading.Lock()
+        self._policies: dict[str, ParsedPolicy | None] | None = None
+
+    def reset(self) -> None:
+        """Forget the policies, so that they are listed again on next use: crawlers reset the registry on every crawl."""
+        with self._lock:
+            self._policies = None
+
+    def list_policies(self) -> list[Policy]:
+        return [parsed_policy[0] for parsed_policy in self._load().values() if parsed_policy]
+
+    def get(self, policy_id: str) -> ParsedPolicy | None:
+        policies = self._load()
+        with self._lock:
+            if policy_id in policies:
+                return policies[policy_id]
+        # concurrent misses for the same policy may fetch it more than once, the first result is kept
+        parsed_policy = self._fetch(policy_id)
+        with self._lock:
+            return policies.setdefault(policy_id, parsed_policy)
+
+    def _load(self) -> dict[str, ParsedPolicy | None]:
+        if self._policies is not None:
+            return self._policies
+        with self._lock:
+            if self._policies is None:
+                policies = self._ws.cluster_policies.list()
+                self._policies = {policy.policy_id: self._parse(policy) for policy in policies if policy.policy_id}
+            return self._policies
+
+    def _fetch(self, policy_id: str) -> ParsedPolicy | None:
         try:
-            return self._ws.cluster_policies.get(policy_id)
+            return self._parse(self._ws.cluster_policies.get(policy_id))
         except NotFound:
             logger.warning(f"The cluster policy was deleted: {policy_id}")
             return None
 
-    def _check_cluster_policy(self, policy_id: str, source: str) -> list[str]:
-        failures: list[str] = []
-        policy = self._safe_get_cluster_policy(policy_id)
-        if policy:
-            if policy.definition:
-                if azure_sp_conf_present_check(json.loads(policy.definition)):
+    @staticmethod
+    def _parse(policy: Policy) -> ParsedPolicy:
+        definition = json.loads(policy.definition) if policy.definition else None
+        overrides = None
+        if policy.policy_family_definition_overrides:
+            overrides = json.loads(policy.policy_family_definition_overrides)
+        return policy, definition, overrides
+
+
+class CheckClusterMixin(CheckInitScriptMixin):
+    _ws: WorkspaceClient
+    _policies: PolicyRegistry
+    _dbfs_read_chunk_size: int = DBFS_READ_CHUNK_SIZE
+
+    def _safe_get_cluster_policy(self, policy_id: str) -> ParsedPolicy | None:
+        return self._policies.get(policy_id)
+
+    def _check_cluster_policy(self, policy_id: str, source: str, failures: list[str]) -> None:
+        parsed_policy = self._safe_get_cluster_policy(policy_id)
+        if parsed_policy:
+            _, definition, overrides = parsed_policy
+            if definition:
+                if azure_sp_conf_present_check(definition):
                     failures.append(f"{AZURE_SP_CONF_FAILURE_MSG} {source}.")
-            if policy.policy_family_definition_overrides:
-                if azure_sp_conf_present_check(json.loads(policy.policy_family_definition_overrides)):
+            if overrides:
+                if azure_sp_conf_present_check(overrides):
                     failures.append(f"{AZURE_SP_CONF_FAILURE_MSG} {source}.")
-        return failures
 
     def _get_init_script_data(self, init_script_info: InitScriptInfo) -> str | None:
+        read_init_script = self._init_script_reader(init_script_info)
+        if read_init_script is None:
+            return None
         try:
-            match init_script_info:
-                case InitScriptInfo(dbfs=DbfsStorageInfo(destination)):
-                    split = destination.split(":")
-                    if len(split) != INIT_SCRIPT_DBFS_PATH:
-                        return None
-                    data = self._ws.dbfs.read(split[1]).data
-                    if data is not None:
-                        return base64.b64decode(data).decode("utf-8")
-                case InitScriptInfo(workspace=WorkspaceStorageInfo(workspace_file_destination)):
-                    data = self._ws.workspace.export(workspace_file_destination).content
-                    if data is not None:
-                        return base64.b64decode(data).decode("utf-8")
-                case InitScriptInfo(file=LocalFileInfo(destination)):
-                    split = destination.split(":/")
-                    if len(split) != INIT_SCRIPT_LOCAL_PATH:
-                        return None
-                    with open(split[1], "r", encoding="utf-8") as file:
-                        data = file.read()
-                    return data
-
+            content = read_init_script()
+        except (NotFound, BadRequest, FileNotFoundError) as e:
+            logger.warning(f"Error reading {init_script_info}: {e}")
+            return None
+        if not content:
             return None
-        except (NotFound, BadRequest, FileNotFoundError, UnicodeDecodeError) as e:
+        try:
+            return content.decode("utf-8")
+        except UnicodeDecodeError as e:
             logger.warning(f"Error reading {init_script_info}: {e}")
             return None
 
-    def _check_cluster_init_script(self, init_scripts: list[InitScriptInfo], source: str) -> list[str]:
-        failures: list[str] = []
+    def _init_script_reader(self, init_script_info: InitScriptInfo) -> Callable[[], bytes | None] | None:
+        """The function reading the raw content of an init script, if its location is supported."""
+        if init_script_info.dbfs is not None:
+            split = init_script_info.dbfs.destination.split(":")
+            if len(split) != INIT_SCRIPT_DBFS_PATH:
+                return None
+            return functools.partial(self._read_dbfs_file, split[1])
+        if init_script_info.workspace is not None:
+            return functools.partial(self._export_workspace_file, init_script_info.workspace.destination)
+        if init_script_info.file is not None:
+            split = init_script_info.file.destination.split(":/")
+            if len(split) != INIT_SCRIPT_LOCAL_PATH:
+                return None
+            return functools.partial(self._read_local_file, split[1])
+        return None
+
+    def _read_dbfs_file(self, path: str) -> bytes:
+        """Read a file from DBFS, chunk by chunk, as a single DBFS read returns a limited number of bytes."""
+        content = bytearray()
+        while True:
+            response = self._ws.dbfs.read(path, offset=len(content), length=self._dbfs_read_chunk_size)
+            chunk = _decode_base64(response.data)
+            content.extend(chunk)
+            if len(chunk) < self._dbfs_read_chunk_size:
+                break
+        return bytes(content)
+
+    def _export_workspace_file(self, path: str) -> bytes:
+        return _decode_base64(self._ws.workspace.export(path).content)
+
+    @staticmethod
+    def _read_local_file(path: str) -> bytes:
+        with open(path, "rb") as file:
+            return file.read()
+
+    def _check_cluster_init_script(self, init_scripts: list[InitScriptInfo], source: str, failures: list[str]) -> None:
         for init_script_info in init_scripts:
             init_script_data = self._get_init_script_data(init_script_info)
             failures.extend(self.check_init_script(init_script_data, source))
-        return failures
 
-    def _check_spark_conf(self, conf: dict[str, str], source: str) -> list[str]:
-        failures: list[str] = []
-        for key, error in INCOMPATIBLE_SPARK_CONFIG_KEYS.items():
-            if key in conf:
-                failures.append(f"{error}: {key} in {source}.")
+    def _check_spark_conf(self, conf: dict[str, str], source: str, failures: list[str]) -> None:
+        if not conf:
+            return
+        incompatible_keys = conf.keys() & INCOMPATIBLE_SPARK_CONFIG_KEYS.keys()
+        if incompatible_keys:
+            # report in the order of the known incompatible keys to keep the failures stable
+            for key, error in INCOMPATIBLE_SPARK_CONFIG_KEYS.items():
+                if key in incompatible_keys:
+                    failures.append(f"{error}: {key} in {source}.")
         for value in conf.values():
-            if "dbfs:/mnt" in value or "/dbfs/mnt" in value:
+            if _DBFS_MOUNT_PATTERN.search(value):
                 failures.append(f"using DBFS mount in configuration: {value}")
         # Checking if Azure cluster config is present in spark config
         if azure_sp_conf_present_check(conf):
             failures.append(f"{AZURE_SP_CONF_FAILURE_MSG} {source}.")
-        return failures
 
-    def _check_cluster_failures(self, cluster: ClusterDetails, source: str) -> list[str]:
-        failures: list[str] = []
+    def _check_cluster_failures(self, cluster: ClusterDetails, source: str, *, early_exit: bool = False) -> list[str]:
+        """Check a cluster for UC incompatibilities.
 
-        unsupported_cluster_types = [
-            DataSecurityMode.LEGACY_PASSTHROUGH,
-            DataSecurityMode.LEGACY_SINGLE_USER,
-            DataSecurityMode.LEGACY_TABLE_ACL,
-        ]
-        support_status = spark_version_compatibility(cluster.spark_version)
+        With `early_exit`, the init scripts, which are the slowest to check, are not read for a cluster that
+        already fails the other checks.
+        """
+        failures: list[str] = []
+        support_status, is_ml_runtime = _spark_version_info(cluster.spark_version)
         if support_status != "supported":
             failures.append(f"not supported DBR: {cluster.spark_version}")
         if cluster.spark_conf is not None:
-            failures.extend(self._check_spark_conf(cluster.spark_conf, source))
+            self._check_spark_conf(cluster.spark_conf, source, failures)
         # Checking if Azure cluster config is present in cluster policies
         if cluster.policy_id is not None:
-            failures.extend(self._check_cluster_policy(cluster.policy_id, source))
+            self._check_cluster_policy(cluster.policy_id, source, failures)
+        data_security_mode_failures = self._check_data_security_mode(cluster, is_ml_runtime)
         if cluster.init_scripts is not None:
-            failures.extend(self._check_cluster_init_script(cluster.init_scripts, source))
-        if cluster.data_security_mode == DataSecurityMode.NONE:
-            failures.append("No isolation shared clusters not supported in UC")
-        if cluster.data_security_mode in unsupported_cluster_types:
-            failures.append(f"cluster type not supported : {cluster.data_security_mode.value}")
-        if cluster.data_security_mode == DataSecurityMode.NONE and is_mlr(cluster.spark_version):
-            failures.append("Shared Machine Learning Runtime clusters are not supported in UC")
+            if early_exit and (failures or data_security_mode_failures):
+                logger.debug(f"Skipping init scripts of cluster {cluster.cluster_id}, which is not supported already")
+            else:
+                self._check_cluster_init_script(cluster.init_scripts, source, failures)
+        failures.extend(data_security_mode_failures)
+        return failures
 
+    @staticmethod
+    def _check_data_security_mode(cluster: ClusterDetails, is_ml_runtime: bool) -> list[str]:
+        data_security_mode = cluster.data_security_mode
+        if data_security_mode in _UNSUPPORTED_DATA_SECURITY_MODES:
+            return [f"cluster type not supported : {data_security_mode.value}"]
+        if data_security_mode != DataSecurityMode.NONE:
+            return []
+        failures = ["No isolation shared clusters not supported in UC"]
+        if is_ml_runtime:
+            failures.append("Shared Machine Learning Runtime clusters are not supported in UC")
         return failures
 
 
 class ClustersCrawler(CrawlerBase[ClusterInfo], CheckClusterMixin):
-    def __init__(self, ws: WorkspaceClient, sql_backend: SqlBackend, schema: str):
+    def __init__(
+        self,
+        ws: WorkspaceClient,
+        sql_backend: SqlBackend,
+        schema: str,
+        *,
+        early_exit: bool = True,
+        batch_size: int = ASSESSMENT_BATCH_SIZE,
+        dbfs_read_chunk_size: int = DBFS_READ_CHUNK_SIZE,
+    ):
         super().__init__(sql_backend, "hive_metastore", schema, "clusters", ClusterInfo)
         self._ws = ws
+        self._policies = PolicyRegistry(ws)
+        self._early_exit = early_exit
+        self._batch_size = batch_size
+        self._dbfs_read_chunk_size = dbfs_read_chunk_size
 
     def _crawl(self) -> Iterable[ClusterInfo]:
-        all_clusters = list(self._ws.clusters.list())
-        return list(self._assess_clusters(all_clusters))
-
-    def _assess_clusters(self, all_clusters: Iterable[ClusterDetails]):
-        for cluster in all_clusters:
-            if cluster.cluster_source == ClusterSource.JOB:
-                continue
-            creator = cluster.creator_user_name or None
-            if not creator:
-                logger.warning(
-                    f"Cluster {cluster.cluster_id} have Unknown creator, it means that the original creator "
-                    f"has been deleted and should be re-created"
-                )
-            cluster_info = ClusterInfo.from_cluster_details(cluster)
-            failures = self._check_cluster_failures(cluster, "cluster")
-            if len(failures) > 0:
-                cluster_info.success = 0
-                cluster_info.failures = json.dumps(failures)
-            yield cluster_info
+        self._policies.reset()
+        return self._assess_clusters(self._ws.clusters.list())
+
+    def _assess_clusters(self, all_clusters: Iterable[ClusterDetails]) -> Iterator[ClusterInfo]:
+        clusters = (cluster for cluster in all_clusters if cluster.cluster_source not in _SKIPPED_CLUSTER_SOURCES)
+        # the assessment of a cluster is dominated by policy and init script API calls, so clusters are
+        # assessed concurrently while the results are kept in the order of the listing
+        return _assess_concurrently("assess_clusters", self._assess_cluster, clusters, self._batch_size)
+
+    def _assess_cluster(self, cluster: ClusterDetails) -> ClusterInfo:
+        creator = cluster.creator_user_name or None
+        if not creator:
+            logger.warning(
+                f"Cluster {cluster.cluster_id} have Unknown creator, it means that the original creator "
+                f"has been deleted and should be re-created"
+            )
+        cluster_info = ClusterInfo.from_cluster_details(cluster)
+        failures = self._check_cluster_failures(cluster, "cluster", early_exit=self._early_exit)
+        if len(failures) > 0:
+            cluster_info.success = 0
+            cluster_info.failures = json.dumps(failures)
+        return cluster_info
 
     def _try_fetch(self) -> Iterable[ClusterInfo]:
         for row in self._fetch(f"SELECT * FROM {escape_sql_identifier(self.full_name)}"):
@@ -200,7 +364,7 @@ class ClusterOwnership(Ownership[ClusterInfo]):
         return record.creator
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyInfo:
     policy_id: str
     policy_name: str
@@ -215,42 +379,53 @@ class PolicyInfo:
 
 
 class PoliciesCrawler(CrawlerBase[PolicyInfo], CheckClusterMixin):
-    def __init__(self, ws: WorkspaceClient, sql_backend: SqlBackend, schema):
+    def __init__(
+        self,
+        ws: WorkspaceClient,
+        sql_backend: SqlBackend,
+        schema,
+        *,
+        batch_size: int = ASSESSMENT_BATCH_SIZE,
+    ):
         super().__init__(sql_backend, "hive_metastore", schema, "policies", PolicyInfo)
         self._ws = ws
+        self._policies = PolicyRegistry(ws)
+        self._batch_size = batch_size
 
     def _crawl(self) -> Iterable[PolicyInfo]:
-        all_policies = list(self._ws.cluster_policies.list())
-        return list(self._assess_policies(all_policies))
-
-    def _assess_policies(self, all_policies: Iterable[Policy]) -> Iterable[PolicyInfo]:
-        for policy in all_policies:
-            failures: list[str] = []
-            if policy.policy_id is None:
-                continue
-            failures.extend(self._check_cluster_policy(policy.policy_id, "policy"))
-            spark_version = None
-            if policy.definition is not None:
-                try:
-                    spark_version = json.dumps(json.loads(policy.definition)["spark_version"])
-                except KeyError:
-                    pass
-            policy_name = policy.name or "UNDEFINED"
-            creator_name = policy.creator_user_name or None
-
-            policy_info = PolicyInfo(
-                policy_id=policy.policy_id,
-                policy_description=policy.description,
-                policy_name=policy_name,
-                spark_version=spark_version,
-                success=1,
-                failures="[]",
-                creator=creator_name,
-            )
-            if len(failures) > 0:
-                policy_info.success = 0
-                policy_info.failures = json.dumps(failures)
-            yield policy_info
+        self._policies.reset()
+        return self._assess_policies(self._policies.list_policies())
+
+    def _assess_policies(self, all_policies: Iterable[Policy]) -> Iterator[PolicyInfo]:
+        policies = (policy for policy in all_policies if policy.policy_id is not None)
+        return _assess_concurrently("assess_policies", self._assess_policy, policies, self._batch_size)
+
+    def _assess_policy(self, policy: Policy) -> PolicyInfo:
+        assert policy.policy_id is not None
+        failures: list[str] = []
+        self._check_cluster_policy(policy.policy_id, "policy", failures)
+        spark_version = None
+        parsed_policy = self._safe_get_cluster_policy(policy.policy_id)
+        if parsed_policy:
+            _, definition, _ = parsed_policy
+            if definition and "spark_version" in definition:
+                spark_version = json.dumps(definition["spark_version"])
+        policy_name = policy.name or "UNDEFINED"
+        creator_name = policy.creator_user_name or None
+
+        policy_info = PolicyInfo(
+            policy_id=policy.policy_id,
+            policy_description=policy.description,
+            policy_name=policy_name,
+            spark_version=spark_version,
+            success=1,
+            failures="[]",
+            creator=creator_name,
+        )
+        if len(failures) > 0:
+            policy_info.success = 0
+            policy_info.failures = json.dumps(failures)
+        return policy_info
 
     def _try_fetch(self) -> Iterable[PolicyInfo]:
         for row in self._fetch(f"SELECT * FROM {escape_sql_identifier(self.full_name)}"):
@@ -21,19 +21,16 @@ INIT_SCRIPT_DBFS_PATH = 2
 INIT_SCRIPT_LOCAL_PATH = 2
 
 
+# A single alternation of the Azure service principal configs, to scan a text once for all of them
+_AZURE_SP_CONF_PATTERN = re.compile("|".join(AZURE_SP_CONF))
+
+
 def azure_sp_conf_in_init_scripts(init_script_data: str) -> bool:
-    for conf in AZURE_SP_CONF:
-        if re.search(conf, init_script_data):
-            return True
-    return False
+    return _AZURE_SP_CONF_PATTERN.search(init_script_data) is not None
 
 
 def azure_sp_conf_present_check(config: dict) -> bool:
-    for key in config.keys():
-        for conf in AZURE_SP_CONF:
-            if re.search(conf, key):
-                return True
-    return False
+    return any(_AZURE_SP_CONF_PATTERN.search(key) for key in config.keys())
 
 
 def runtime_version_tuple(spark_version: str | None) -> tuple[int, int] | None:
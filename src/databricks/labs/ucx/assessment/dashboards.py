@@ -3,7 +3,7 @@ from __future__ import annotations
 import itertools
 import json
 import logging
-from collections.abc import Iterable, Iterator
+from collections.abc import Collection, Iterable, Iterator
 from dataclasses import dataclass, field
 from typing import ClassVar
 
@@ -317,13 +317,13 @@ class LakeviewDashboardCrawler(CrawlerBase[Dashboard]):
         schema: str,
         *,
         include_dashboard_ids: list[str] | None = None,
-        exclude_dashboard_ids: list[str] | None = None,
+        exclude_dashboard_ids: Collection[str] | None = None,
         include_query_ids: list[str] | None = None,
     ):
         super().__init__(sql_backend, "hive_metastore", schema, "lakeview_dashboards", Dashboard)
         self._ws = ws
         self._include_dashboard_ids = include_dashboard_ids
-        self._exclude_dashboard_ids = exclude_dashboard_ids
+        self._exclude_dashboard_ids = frozenset(exclude_dashboard_ids or ())
         self._include_query_ids = include_query_ids
 
     def _crawl(self) -> Iterable[Dashboard]:
@@ -331,7 +331,7 @@ class LakeviewDashboardCrawler(CrawlerBase[Dashboard]):
         for sdk_dashboard in self._list_dashboards():
             if sdk_dashboard.dashboard_id is None:
                 continue
-            if sdk_dashboard.dashboard_id in (self._exclude_dashboard_ids or []):
+            if sdk_dashboard.dashboard_id in self._exclude_dashboard_ids:
                 continue
             dashboard = Dashboard.from_sdk_lakeview_dashboard(sdk_dashboard)
             dashboards.append(dashboard)
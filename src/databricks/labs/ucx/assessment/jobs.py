@@ -1,6 +1,6 @@
 import json
 import logging
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from hashlib import sha256
@@ -25,7 +25,7 @@ from databricks.sdk.service.jobs import (
     Job,
 )
 
-from databricks.labs.ucx.assessment.clusters import CheckClusterMixin
+from databricks.labs.ucx.assessment.clusters import CheckClusterMixin, PolicyRegistry
 from databricks.labs.ucx.assessment.crawlers import spark_version_compatibility
 from databricks.labs.ucx.framework.crawlers import CrawlerBase
 from databricks.labs.ucx.framework.owners import Ownership
@@ -104,8 +104,8 @@ class JobsCrawler(CrawlerBase[JobInfo], JobsMixin, CheckClusterMixin):
         ws (WorkspaceClient): The workspace client to crawl the jobs with.
         sql_backend (SqlBackend): The SQL backend to store the results with.
         schema (str): The schema to store the results in.
-        include_job_ids (list[int] | None): If provided, only include these job ids. Otherwise, include all jobs.
-        exclude_job_ids (list[int] | None): If provided, exclude these job ids. Otherwise, include all jobs. Note: We
+        include_job_ids (Collection[int] | None): If provided, only include these job ids. Otherwise, include all jobs.
+        exclude_job_ids (Collection[int] | None): If provided, exclude these job ids. Otherwise, include all jobs. Note: We
             prefer `include_job_ids` for more strict scoping, but sometimes it's easier to exclude a few jobs.
     """
 
@@ -115,13 +115,14 @@ class JobsCrawler(CrawlerBase[JobInfo], JobsMixin, CheckClusterMixin):
         sql_backend: SqlBackend,
         schema,
         *,
-        include_job_ids: list[int] | None = None,
-        exclude_job_ids: list[int] | None = None,
+        include_job_ids: Collection[int] | None = None,
+        exclude_job_ids: Collection[int] | None = None,
     ):
         super().__init__(sql_backend, "hive_metastore", schema, "jobs", JobInfo)
         self._ws = ws
-        self._include_job_ids = include_job_ids
-        self._exclude_job_ids = exclude_job_ids
+        self._include_job_ids = frozenset(include_job_ids) if include_job_ids is not None else None
+        self._exclude_job_ids = frozenset(exclude_job_ids) if exclude_job_ids is not None else None
+        self._policies = PolicyRegistry(ws)
 
     def _list_jobs(self) -> Iterable[BaseJob]:
         """List the jobs.
@@ -140,6 +141,7 @@ class JobsCrawler(CrawlerBase[JobInfo], JobsMixin, CheckClusterMixin):
             logger.error("Cannot list jobs", exc_info=e)
 
     def _crawl(self) -> Iterable[JobInfo]:
+        self._policies.reset()
         all_jobs = list(self._list_jobs())
         all_clusters = {c.cluster_id: c for c in self._ws.clusters.list() if c.cluster_id}
         return self._assess_jobs(all_jobs, all_clusters)
@@ -227,6 +229,7 @@ class SubmitRunsCrawler(CrawlerBase[SubmitRunInfo], JobsMixin, CheckClusterMixin
         super().__init__(sql_backend, "hive_metastore", schema, "submit_runs", SubmitRunInfo)
         self._ws = ws
         self._num_days_history = num_days_history
+        self._policies = PolicyRegistry(ws)
 
     @staticmethod
     def _dt_to_ms(date_time: datetime):
@@ -237,6 +240,7 @@ class SubmitRunsCrawler(CrawlerBase[SubmitRunInfo], JobsMixin, CheckClusterMixin
         return datetime.now(timezone.utc)
 
     def _crawl(self) -> Iterable[SubmitRunInfo]:
+        self._policies.reset()
         end = self._dt_to_ms(self._get_current_dttm())
         start = self._dt_to_ms(self._get_current_dttm() - timedelta(days=self._num_days_history))
         submit_runs = self._ws.jobs.list_runs(
@@ -253,21 +257,19 @@ class SubmitRunsCrawler(CrawlerBase[SubmitRunInfo], JobsMixin, CheckClusterMixin
         for row in self._fetch(f"SELECT * FROM {escape_sql_identifier(self.full_name)}"):
             yield SubmitRunInfo(*row)
 
-    def _check_spark_conf(self, conf: dict[str, str], source: str) -> list[str]:
-        failures: list[str] = []
+    def _check_spark_conf(self, conf: dict[str, str], source: str, failures: list[str]) -> None:
         for key in conf.keys():
             if any(pattern in key for pattern in self._FS_LEVEL_CONF_SETTING_PATTERNS):
                 failures.append(f"Potentially unsupported config property: {key}")
 
-        failures.extend(super()._check_spark_conf(conf, source))
-        return failures
+        super()._check_spark_conf(conf, source, failures)
 
-    def _check_cluster_failures(self, cluster: ClusterDetails, source: str) -> list[str]:
+    def _check_cluster_failures(self, cluster: ClusterDetails, source: str, *, early_exit: bool = False) -> list[str]:
         failures: list[str] = []
         if cluster.aws_attributes and cluster.aws_attributes.instance_profile_arn:
             failures.append(f"using instance profile: {cluster.aws_attributes.instance_profile_arn}")
 
-        failures.extend(super()._check_cluster_failures(cluster, source))
+        failures.extend(super()._check_cluster_failures(cluster, source, early_exit=early_exit))
         return failures
 
     @staticmethod
@@ -8,7 +8,7 @@ from databricks.labs.lsql.backends import SqlBackend
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.errors import NotFound
 
-from databricks.labs.ucx.assessment.clusters import CheckClusterMixin
+from databricks.labs.ucx.assessment.clusters import CheckClusterMixin, PolicyRegistry
 from databricks.labs.ucx.framework.crawlers import CrawlerBase
 from databricks.labs.ucx.framework.owners import Ownership
 from databricks.labs.ucx.framework.utils import escape_sql_identifier
@@ -35,9 +35,10 @@ class PipelinesCrawler(CrawlerBase[PipelineInfo], CheckClusterMixin):
         super().__init__(sql_backend, "hive_metastore", schema, "pipelines", PipelineInfo)
         self._ws = ws
         self._include_pipeline_ids = include_pipeline_ids
+        self._policies = PolicyRegistry(ws)
 
     def _crawl(self) -> Iterable[PipelineInfo]:
-
+        self._policies.reset()
         pipeline_ids = []
         if self._include_pipeline_ids is not None:
             pipeline_ids = self._include_pipeline_ids
@@ -60,9 +61,9 @@ class PipelinesCrawler(CrawlerBase[PipelineInfo], CheckClusterMixin):
                     f"has been deleted and should be re-created"
                 )
             pipeline_config = pipeline.spec.configuration
-            failures = []
+            failures: list[str] = []
             if pipeline_config:
-                failures.extend(self._check_spark_conf(pipeline_config, "pipeline"))
+                self._check_spark_conf(pipeline_config, "pipeline", failures)
             clusters = pipeline.spec.clusters
             if clusters:
                 self._pipeline_clusters(clusters, failures)
@@ -78,12 +79,12 @@ class PipelinesCrawler(CrawlerBase[PipelineInfo], CheckClusterMixin):
     def _pipeline_clusters(self, clusters, failures):
         for cluster in clusters:
             if cluster.spark_conf:
-                failures.extend(self._check_spark_conf(cluster.spark_conf, "pipeline cluster"))
+                self._check_spark_conf(cluster.spark_conf, "pipeline cluster", failures)
             # Checking if cluster config is present in cluster policies
             if cluster.policy_id:
-                failures.extend(self._check_cluster_policy(cluster.policy_id, "pipeline cluster"))
+                self._check_cluster_policy(cluster.policy_id, "pipeline cluster", failures)
             if cluster.init_scripts:
-                failures.extend(self._check_cluster_init_script(cluster.init_scripts, "pipeline cluster"))
+                self._check_cluster_init_script(cluster.init_scripts, "pipeline cluster", failures)
 
     def _try_fetch(self) -> Iterable[PipelineInfo]:
         for row in self._fetch(f"SELECT * FROM {escape_sql_identifier(self.full_name)}"):
@@ -1,10 +1,12 @@
 import abc
 import logging
+import os
 import sys
 from collections.abc import Callable, Iterable
 from datetime import timedelta
 from functools import cached_property
 from pathlib import Path
+from weakref import WeakValueDictionary
 
 from databricks.labs.blueprint.installation import Installation
 from databricks.labs.blueprint.installer import InstallState
@@ -97,6 +99,13 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# the index is read-only, so the linters can share one empty instance
+_EMPTY_MIGRATION_INDEX = TableMigrationIndex(())
+
+# Contexts built for the same workspace client share its administrator locator, so the administrator is searched for
+# once per client. A locator references its client, hence a cached id cannot be reused by another client.
+_ADMINISTRATOR_LOCATORS: WeakValueDictionary[int, AdministratorLocator] = WeakValueDictionary()
+
 
 class GlobalContext(abc.ABC):
     def __init__(self, named_parameters: dict[str, str] | None = None):
@@ -142,22 +151,34 @@ class GlobalContext(abc.ABC):
     def connect_config(self) -> core.Config:
         return self.workspace_client.config
 
+    @cached_property
+    def _cloud(self) -> str:
+        if self.connect_config.is_azure:
+            return "azure"
+        if self.connect_config.is_aws:
+            return "aws"
+        return "gcp"
+
     @cached_property
     def is_azure(self) -> bool:
-        return self.connect_config.is_azure
+        return self._cloud == "azure"
 
     @cached_property
     def is_aws(self) -> bool:
-        return self.connect_config.is_aws
+        return self._cloud == "aws"
 
     @cached_property
     def is_gcp(self) -> bool:
-        return not self.is_aws and not self.is_azure
+        return self._cloud == "gcp"
 
     @cached_property
     def inventory_database(self) -> str:
         return self.config.inventory_database
 
+    @cached_property
+    def include_object_permissions(self) -> list[str] | None:
+        return self.config.include_object_permissions
+
     @cached_property
     def workspace_listing(self) -> generic.WorkspaceListing:
         return generic.WorkspaceListing(
@@ -190,7 +211,7 @@ class GlobalContext(abc.ABC):
         return generic.GenericPermissionsSupport(
             self.workspace_client,
             acl_listing,
-            include_object_permissions=self.config.include_object_permissions,
+            include_object_permissions=self.include_object_permissions,
         )
 
     @cached_property
@@ -203,25 +224,23 @@ class GlobalContext(abc.ABC):
         return redash.RedashPermissionsSupport(
             self.workspace_client,
             acl_listing,
-            include_object_permissions=self.config.include_object_permissions,
+            include_object_permissions=self.include_object_permissions,
         )
 
     @cached_property
     def scim_entitlements_support(self) -> ScimSupport:
-        return ScimSupport(self.workspace_client, include_object_permissions=self.config.include_object_permissions)
+        return ScimSupport(self.workspace_client, include_object_permissions=self.include_object_permissions)
 
     @cached_property
     def secret_scope_acl_support(self) -> SecretScopesSupport:
-        return SecretScopesSupport(
-            self.workspace_client, include_object_permissions=self.config.include_object_permissions
-        )
+        return SecretScopesSupport(self.workspace_client, include_object_permissions=self.include_object_permissions)
 
     @cached_property
     def legacy_table_acl_support(self) -> TableAclSupport:
         return TableAclSupport(
             self.grants_crawler,
             self.sql_backend,
-            include_object_permissions=self.config.include_object_permissions,
+            include_object_permissions=self.include_object_permissions,
         )
 
     @cached_property
@@ -283,7 +302,7 @@ class GlobalContext(abc.ABC):
             self.sql_backend,
             self.inventory_database,
             include_job_ids=self.config.include_job_ids,
-            exclude_job_ids=[int(job_id) for job_id in self.install_state.jobs.values()],
+            exclude_job_ids=frozenset(int(job_id) for job_id in self.install_state.jobs.values()),
         )
 
     @cached_property
@@ -315,7 +334,7 @@ class GlobalContext(abc.ABC):
             self.sql_backend,
             self.inventory_database,
             include_dashboard_ids=self.config.include_dashboard_ids,
-            exclude_dashboard_ids=list(self.install_state.dashboards.values()),
+            exclude_dashboard_ids=frozenset(self.install_state.dashboards.values()),
             include_query_ids=self.config.include_query_ids,
         )
 
@@ -379,25 +398,19 @@ class GlobalContext(abc.ABC):
     def table_ownership_grant_loader(self) -> TableOwnershipGrantLoader:
         return TableOwnershipGrantLoader(self.tables_crawler, self.default_securable_ownership)
 
+    def _named_parameter_ids(self, name: str) -> list[str] | None:
+        ids = self.named_parameters.get(name)
+        return ids.split(',') if ids is not None else None
+
     @cached_property
     def pipelines_migrator(self) -> PipelinesMigrator:
-        include_pipeline_ids = (
-            self.named_parameters.get('include_pipeline_ids', '').split(',')
-            if 'include_pipeline_ids' in self.named_parameters
-            else None
-        )
-        exclude_pipeline_ids = (
-            self.named_parameters.get('exclude_pipeline_ids', '').split(',')
-            if 'exclude_pipeline_ids' in self.named_parameters
-            else None
-        )
         return PipelinesMigrator(
             self.workspace_client,
             self.pipelines_crawler,
             self.jobs_crawler,
             self.config.ucx_catalog,
-            include_pipeline_ids=include_pipeline_ids,
-            exclude_pipeline_ids=exclude_pipeline_ids,
+            include_pipeline_ids=self._named_parameter_ids('include_pipeline_ids'),
+            exclude_pipeline_ids=self._named_parameter_ids('exclude_pipeline_ids'),
         )
 
     @cached_property
@@ -465,14 +478,15 @@ class GlobalContext(abc.ABC):
 
     @cached_property
     def principal_locations_retriever(self) -> Callable[[], list[ComputeLocations]]:
-        def inner():
-            if self.is_azure:
-                return self.azure_acl.get_eligible_locations_principals()
-            if self.is_aws:
-                return self.aws_acl.get_eligible_locations_principals()
+        if self.is_azure:
+            return self.azure_acl.get_eligible_locations_principals
+        if self.is_aws:
+            return self.aws_acl.get_eligible_locations_principals
+
+        def not_implemented() -> list[ComputeLocations]:
             raise NotImplementedError("Not implemented for GCP.")
 
-        return inner
+        return not_implemented
 
     @cached_property
     def principal_acl(self) -> PrincipalACL:
@@ -556,8 +570,10 @@ class GlobalContext(abc.ABC):
 
     @cached_property
     def site_packages_path(self) -> Path:
-        lookup = self.path_lookup
-        return next(path for path in lookup.library_roots if "site-packages" in path.as_posix())
+        for path in self.path_lookup.library_roots:
+            if "site-packages" in os.fspath(path):
+                return path
+        raise ValueError("No site-packages found in library roots")
 
     @cached_property
     def path_lookup(self) -> PathLookup:
@@ -593,7 +609,7 @@ class GlobalContext(abc.ABC):
             self.jobs_crawler,
             self.dependency_resolver,
             self.path_lookup,
-            TableMigrationIndex([]),  # TODO: bring back self.tables_migrator.index()
+            _EMPTY_MIGRATION_INDEX,  # TODO: bring back self.tables_migrator.index()
             self.directfs_access_crawler_for_paths,
             self.used_tables_crawler_for_paths,
         )
@@ -603,7 +619,7 @@ class GlobalContext(abc.ABC):
         return QueryLinter(
             self.sql_backend,
             self.inventory_database,
-            TableMigrationIndex([]),
+            _EMPTY_MIGRATION_INDEX,
             self.directfs_access_crawler_for_queries,
             self.used_tables_crawler_for_queries,
             [self.redash_crawler, self.lakeview_crawler],
@@ -665,7 +681,14 @@ class GlobalContext(abc.ABC):
 
     @cached_property
     def administrator_locator(self) -> AdministratorLocator:
-        return AdministratorLocator(self.workspace_client)
+        # The locator caches the administrator it finds: ownership objects must share this one instead of creating their
+        # own, otherwise each of them searches for an administrator again.
+        key = id(self.workspace_client)
+        locator = _ADMINISTRATOR_LOCATORS.get(key)
+        if locator is None:
+            locator = AdministratorLocator(self.workspace_client)
+            _ADMINISTRATOR_LOCATORS[key] = locator
+        return locator
 
 
 class CliContext(GlobalContext, abc.ABC):
@@ -1,4 +1,5 @@
 import logging
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable, Sequence
 from datetime import timedelta
@@ -129,14 +130,26 @@ class AdministratorLocator:
         """
         self._ws = ws
         self._finders = finders
+        # Ownership of different resources is often determined concurrently; the lock ensures the (expensive) search
+        # for an administrator happens only once per locator.
+        self._lock = threading.Lock()
+        self._admin_searched = False
+        self._found_admin: str | None = None
 
     @cached_property
     def _workspace_id(self) -> int:
         # Makes a REST call, so we cache it.
         return self._ws.get_workspace_id()
 
-    @cached_property
-    def _found_admin(self) -> str | None:
+    def _locate_admin(self) -> str | None:
+        if not self._admin_searched:
+            with self._lock:
+                if not self._admin_searched:
+                    self._found_admin = self._find_admin()
+                    self._admin_searched = True
+        return self._found_admin
+
+    def _find_admin(self) -> str | None:
 
         # Ordering helper: User.user_name is typed as optional but we can't sort by None.
         # (The finders already filter out users without a user-name.)
@@ -159,7 +172,7 @@ class AdministratorLocator:
         Raises:
               RuntimeError if an admin user cannot be found in the current workspace.
         """
-        found_admin = self._found_admin
+        found_admin = self._locate_admin()
         if found_admin is None:
             msg = f"No active workspace or account administrator can be found for workspace: {self._workspace_id}"
             raise RuntimeError(msg)
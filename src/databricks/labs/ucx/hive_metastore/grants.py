@@ -832,25 +832,20 @@ class MigrateGrants:
         return {g.name_in_workspace: g.name_in_account for g in self._group_manager.snapshot()}
 
     @cached_property
-    def _grants(self) -> list[Grant]:
-        # Accumulate grants from all loaders skips ownership grants
-        grants = []
+    def _grants(self) -> dict[str, list[Grant]]:
+        # Accumulate grants from all loaders skips ownership grants, indexed by the key of the object they apply to
+        grants = defaultdict(list)
         for index, loader in enumerate(self._grant_loaders):
             for grant in loader():
                 # Skip ownership grants for all loaders other than the first one
                 # The assumption is that the first one will be designated as the ownership loader
                 if index != 0 and grant.action_type == "OWN":
                     continue
-                grants.append(grant)
-        return grants
+                grants[grant.object_key].append(grant)
+        return dict(grants)
 
     def _match_grants(self, src: SecurableObject) -> list[Grant]:
-        matched_grants = []
-        for grant in self._grants:
-            if grant.object_key != src.key:
-                continue
-            grant = self._replace_account_group(grant)
-            matched_grants.append(grant)
+        matched_grants = [self._replace_account_group(grant) for grant in self._grants.get(src.key, [])]
         return sorted(matched_grants, key=lambda g: g.order)
 
     def _replace_account_group(self, grant: Grant) -> Grant:
@@ -84,7 +84,8 @@ class PipelinesMigrator:
             pipeline_ids_to_migrate = [p.pipeline_id for p in self._pipeline_crawler.snapshot()]
 
         if self._exclude_pipeline_ids is not None:
-            pipeline_ids_to_migrate = list(set(pipeline_ids_to_migrate) - set(self._exclude_pipeline_ids))
+            exclude_pipeline_ids = frozenset(self._exclude_pipeline_ids)
+            pipeline_ids_to_migrate = [p for p in pipeline_ids_to_migrate if p not in exclude_pipeline_ids]
         return pipeline_ids_to_migrate
 
     def migrate_pipelines(self) -> None:
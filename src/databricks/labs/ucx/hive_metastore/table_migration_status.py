@@ -1,9 +1,12 @@
 import datetime
 import logging
-from dataclasses import dataclass, replace
-from collections.abc import Iterable, KeysView
+from dataclasses import dataclass
+from collections.abc import Iterable, KeysView, Sequence
+from functools import partial
+from operator import itemgetter
 from typing import ClassVar
 
+from databricks.labs.blueprint.parallel import Threads
 from databricks.labs.lsql.backends import SqlBackend
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.errors import DatabricksError, NotFound
@@ -11,12 +14,12 @@ from databricks.sdk.service.catalog import CatalogInfo, CatalogType, SchemaInfo
 
 from databricks.labs.ucx.framework.crawlers import CrawlerBase
 from databricks.labs.ucx.framework.utils import escape_sql_identifier
-from databricks.labs.ucx.hive_metastore.tables import TablesCrawler
+from databricks.labs.ucx.hive_metastore.tables import Table, TablesCrawler
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableMigrationStatus:
     src_schema: str
     src_table: str
@@ -55,7 +58,8 @@ class TableView:
 
 class TableMigrationIndex:
     def __init__(self, tables: Iterable[TableMigrationStatus]):
-        self._index = {(ms.src_schema, ms.src_table): ms for ms in tables}
+        # table names are case-insensitive: keys are lowered once here, lookups with lowercase names need no copies
+        self._index = {(ms.src_schema.lower(), ms.src_table.lower()): ms for ms in tables}
 
     def is_migrated(self, schema: str, table: str) -> bool:
         """Check if a table is migrated."""
@@ -63,7 +67,7 @@ class TableMigrationIndex:
 
     def get(self, schema: str, table: str) -> TableMigrationStatus | None:
         """Get the migration status for a table. If the table is not migrated, return None."""
-        dst = self._index.get((schema.lower(), table.lower()))
+        dst = self._index.get((schema, table)) or self._index.get((schema.lower(), table.lower()))
         if not dst or not dst.dst_table:
             return None
         return dst
@@ -79,9 +83,7 @@ class TableMigrationStatusRefresher(CrawlerBase[TableMigrationStatus]):
     properties for the presence of the marker.
     """
 
-    _skip_catalog_types = {
-        CatalogType.SYSTEM_CATALOG,
-    }
+    _skip_catalog_types = frozenset({CatalogType.SYSTEM_CATALOG})
 
     def __init__(self, ws: WorkspaceClient, sql_backend: SqlBackend, schema, tables_crawler: TablesCrawler):
         super().__init__(sql_backend, "hive_metastore", schema, "migration_status", TableMigrationStatus)
@@ -92,29 +94,49 @@ class TableMigrationStatusRefresher(CrawlerBase[TableMigrationStatus]):
         return TableMigrationIndex(self.snapshot(force_refresh=force_refresh))
 
     def get_seen_tables(self) -> dict[str, str]:
+        """The Unity Catalog tables that were upgraded from a HMS table, mapped to the HMS table they were upgraded from.
+
+        Listing the tables is a round-trip per schema, hence the schemas are listed concurrently. The listings are merged
+        in schema order regardless, so that which table wins when several are upgraded from the same HMS table does not
+        depend on which listing completes first.
+        """
+        tasks = []
+        for position, schema in enumerate(self._iter_schemas()):
+            tasks.append(partial(self._list_upgraded_tables_at, position, schema))
         seen_tables: dict[str, str] = {}
-        for schema in self._iter_schemas():
-            if schema.catalog_name is None or schema.name is None:
+        for _, upgraded_tables in sorted(Threads.strict("listing upgraded tables", tasks), key=itemgetter(0)):
+            seen_tables.update(upgraded_tables)
+        return seen_tables
+
+    def _list_upgraded_tables_at(self, position: int, schema: SchemaInfo) -> tuple[int, dict[str, str]]:
+        return position, self._list_upgraded_tables(schema)
+
+    def _list_upgraded_tables(self, schema: SchemaInfo) -> dict[str, str]:
+        upgraded_tables: dict[str, str] = {}
+        if schema.catalog_name is None or schema.name is None:
+            return upgraded_tables
+        try:
+            # ws.tables.list returns Iterator[TableInfo], so we need to convert it to a list in order to catch the exception
+            # only the table properties are inspected, so the column definitions are left out of the response
+            tables = list(
+                self._ws.tables.list(catalog_name=schema.catalog_name, schema_name=schema.name, omit_columns=True)
+            )
+        except NotFound:
+            logger.warning(f"Schema {schema.full_name} no longer exists. Skipping checking its migration status.")
+            return upgraded_tables
+        except DatabricksError as e:
+            logger.warning(f"Error while listing tables in schema: {schema.full_name}", exc_info=e)
+            return upgraded_tables
+        for table in tables:
+            if not table.properties:
                 continue
-            try:
-                # ws.tables.list returns Iterator[TableInfo], so we need to convert it to a list in order to catch the exception
-                tables = list(self._ws.tables.list(catalog_name=schema.catalog_name, schema_name=schema.name))
-            except NotFound:
-                logger.warning(f"Schema {schema.full_name} no longer exists. Skipping checking its migration status.")
+            if "upgraded_from" not in table.properties:
                 continue
-            except DatabricksError as e:
-                logger.warning(f"Error while listing tables in schema: {schema.full_name}", exc_info=e)
+            if not table.full_name:
+                logger.warning(f"The table {table.name} in {schema.name} has no full name")
                 continue
-            for table in tables:
-                if not table.properties:
-                    continue
-                if "upgraded_from" not in table.properties:
-                    continue
-                if not table.full_name:
-                    logger.warning(f"The table {table.name} in {schema.name} has no full name")
-                    continue
-                seen_tables[table.full_name.lower()] = table.properties["upgraded_from"].lower()
-        return seen_tables
+            upgraded_tables[table.full_name.lower()] = table.properties["upgraded_from"].lower()
+        return upgraded_tables
 
     def is_migrated(self, schema: str, table: str) -> bool:
         try:
@@ -134,35 +156,50 @@ class TableMigrationStatusRefresher(CrawlerBase[TableMigrationStatus]):
             return True
         return False
 
+    def _migrated_table_keys(self, tables: Sequence[Table]) -> set[str]:
+        """The keys of the tables that are marked as migrated.
+
+        Every check is a separate `SHOW TBLPROPERTIES` round-trip, hence the checks run concurrently.
+        """
+        tasks = [partial(self._migrated_table_key, table) for table in tables]
+        return {key for key in Threads.strict("checking migrated tables", tasks) if key is not None}
+
+    def _migrated_table_key(self, table: Table) -> str | None:
+        if self.is_migrated(table.database.lower(), table.name.lower()):
+            return table.key
+        return None
+
     def _crawl(self) -> Iterable[TableMigrationStatus]:
         all_tables = self._tables_crawler.snapshot()
-        reverse_seen = {v: k for k, v in self.get_seen_tables().items()}
-        timestamp = datetime.datetime.now(datetime.timezone.utc).timestamp()
+        reverse_seen = {upgraded_from: full_name for full_name, upgraded_from in self.get_seen_tables().items()}
+        migrated_keys = self._migrated_table_keys([table for table in all_tables if table.key in reverse_seen])
+        update_ts = str(datetime.datetime.now(datetime.timezone.utc).timestamp())
         for table in all_tables:
-            src_schema = table.database.lower()
-            src_table = table.name.lower()
-            table_migration_status = TableMigrationStatus(
-                src_schema=src_schema, src_table=src_table, update_ts=str(timestamp)
+            dst_catalog: str | None = None
+            dst_schema: str | None = None
+            dst_table: str | None = None
+            if table.key in migrated_keys:
+                target_table = reverse_seen[table.key].split(".")
+                if len(target_table) == 3:
+                    dst_catalog, dst_schema, dst_table = target_table
+            yield TableMigrationStatus(
+                src_schema=table.database.lower(),
+                src_table=table.name.lower(),
+                dst_catalog=dst_catalog,
+                dst_schema=dst_schema,
+                dst_table=dst_table,
+                update_ts=update_ts,
             )
-            if table.key in reverse_seen and self.is_migrated(src_schema, src_table):
-                target_table = reverse_seen[table.key]
-                if len(target_table.split(".")) == 3:
-                    table_migration_status = replace(
-                        table_migration_status,
-                        dst_catalog=target_table.split(".")[0],
-                        dst_schema=target_table.split(".")[1],
-                        dst_table=target_table.split(".")[2],
-                    )
-            yield table_migration_status
 
     def _try_fetch(self) -> Iterable[TableMigrationStatus]:
         for row in self._fetch(f"SELECT * FROM {escape_sql_identifier(self.full_name)}"):
             yield TableMigrationStatus(*row)
 
     def _iter_catalogs(self) -> Iterable[CatalogInfo]:
+        skip_catalog_types = self._skip_catalog_types
         try:
             for catalog in self._ws.catalogs.list():
-                if catalog.catalog_type in self._skip_catalog_types:
+                if catalog.catalog_type in skip_catalog_types:
                     continue
                 yield catalog
         except DatabricksError as e:
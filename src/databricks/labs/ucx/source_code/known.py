@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import collections
-import email
 import json
 import logging
 import pkgutil
 import re
 import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from email.message import Message
 from functools import cached_property
 from pathlib import Path
 
@@ -71,21 +71,23 @@ class KnownProblem:
 
 UNKNOWN = Compatibility(False, [])
 _DEFAULT_ENCODING = sys.getdefaultencoding()
+_REQUIREMENT_SPECIFIER_RE = re.compile(r"([a-zA-Z0-9-]+)(?:[<>=].*)?")
+_WHEEL_NAME_RE = re.compile(r"^([a-zA-Z0-9_]+)-.*\.whl$", re.MULTILINE)
 
 
 class KnownList:
-    def __init__(self):
-        self._module_problems = collections.OrderedDict()
+    def __init__(self) -> None:
+        self._module_problems: dict[str, list[KnownProblem]] = {}
         self._library_problems = collections.defaultdict(list)
         known = self._get_known()
         for distribution_name, modules in known.items():
-            specific_modules_first = sorted(modules.items(), key=lambda x: x[0], reverse=True)
-            for module_ref, raw_problems in specific_modules_first:
+            for module_ref, raw_problems in modules.items():
                 problems = [KnownProblem(**_) for _ in raw_problems]
                 self._module_problems[module_ref] = problems
                 self._library_problems[distribution_name].extend(problems)
-        for name in sys.stdlib_module_names:
-            self._module_problems[name] = []
+        self._stdlib_modules = frozenset(sys.stdlib_module_names)
+        # the same modules are imported over and over again throughout the linted code
+        self._module_compatibility: dict[str, Compatibility] = {}
 
     @staticmethod
     def _get_known() -> dict[str, dict[str, list[dict[str, str]]]]:
@@ -101,12 +103,21 @@ class KnownList:
     def module_compatibility(self, name: str) -> Compatibility:
         if not name:
             return UNKNOWN
-        for module, problems in self._module_problems.items():
-            # Find exact matches OR parent module matches
-            # Note sorting when constructing module problems from known.json
-            if not (name == module or name.startswith(module + ".")):
-                continue
-            return Compatibility(True, problems)
+        compatibility = self._module_compatibility.get(name)
+        if compatibility is None:
+            compatibility = self._find_module_compatibility(name)
+            self._module_compatibility[name] = compatibility
+        return compatibility
+
+    def _find_module_compatibility(self, name: str) -> Compatibility:
+        # Find the exact match OR the closest parent module match, walking up from the module itself
+        parts = name.split(".")
+        if parts[0] in self._stdlib_modules:
+            return Compatibility(True, [])
+        for end in range(len(parts), 0, -1):
+            problems = self._module_problems.get(".".join(parts[:end]))
+            if problems is not None:
+                return Compatibility(True, problems)
         return UNKNOWN
 
     def distribution_compatibility(self, name: str) -> Compatibility:
@@ -125,9 +136,7 @@ class KnownList:
 
         See https://pip.pypa.io/en/stable/reference/requirement-specifiers/#requirement-specifiers
         """
-        _requirement_specifier_re = re.compile(r"([a-zA-Z0-9-]+)(?:[<>=].*)?")
-        _wheel_name_re = re.compile(r"^([a-zA-Z0-9_]+)-.*\.whl$", re.MULTILINE)
-        for matcher in (_wheel_name_re, _requirement_specifier_re):
+        for matcher in (_WHEEL_NAME_RE, _REQUIREMENT_SPECIFIER_RE):
             maybe_match = matcher.match(name)
             if not maybe_match:
                 continue
@@ -146,9 +155,15 @@ class KnownList:
             logger.info("No known distributions found; scanning all distributions...")
             known_distributions = {}
         updated_distributions = known_distributions.copy()
+        new_dist_info_folders: dict[str, tuple[Path, Path]] = {}
         for library_root in path_lookup.library_roots:
             for dist_info_folder in library_root.glob("*.dist-info"):
-                cls._analyze_dist_info(dist_info_folder, updated_distributions, library_root)
+                name = DistInfo(dist_info_folder).name
+                if name in known_distributions or name in new_dist_info_folders:
+                    logger.debug(f"Skipping distribution: {name}")
+                    continue
+                new_dist_info_folders[name] = (dist_info_folder, library_root)
+        updated_distributions.update(cls._analyze_new_dist_infos(new_dist_info_folders.values()))
         updated_distributions = dict(sorted(updated_distributions.items()))
         if known_distributions == updated_distributions:
             logger.info("No new distributions found.")
@@ -160,6 +175,24 @@ class KnownList:
                 json.dump(updated_distributions, f, indent=2)
             logger.info(f"Updated known distributions: {known_json.relative_to(Path.cwd())}")
 
+    @classmethod
+    def _analyze_new_dist_infos(cls, dist_info_folders: Iterable[tuple[Path, Path]]) -> dict[str, dict]:
+        # Linting is CPU-bound and the distributions are independent of each other, so they are analyzed in parallel
+        analyzed_distributions: dict[str, dict] = {}
+        with ProcessPoolExecutor() as executor:
+            futures = []
+            for dist_info_folder, library_root in dist_info_folders:
+                futures.append(executor.submit(cls._analyze_new_dist_info, dist_info_folder, library_root))
+            for future in futures:
+                analyzed_distributions.update(future.result())
+        return analyzed_distributions
+
+    @classmethod
+    def _analyze_new_dist_info(cls, dist_info_folder: Path, library_root: Path) -> dict[str, dict]:
+        analyzed_distributions: dict[str, dict] = {}
+        cls._analyze_dist_info(dist_info_folder, analyzed_distributions, library_root)
+        return analyzed_distributions
+
     @classmethod
     def _analyze_dist_info(cls, dist_info_folder, known_distributions, library_root) -> None:
         dist_info = DistInfo(dist_info_folder)
@@ -195,10 +228,7 @@ class KnownList:
 
         empty_index = TableMigrationIndex([])
         relative_path = module_path.relative_to(library_root)
-        module_ref = relative_path.as_posix().replace('/', '.')
-        for suffix in ('.py', '.__init__'):
-            if module_ref.endswith(suffix):
-                module_ref = module_ref[: -len(suffix)]
+        module_ref = relative_path.with_suffix('').as_posix().replace('/', '.').removesuffix('.__init__')
         logger.info(f"Processing module: {module_ref}")
         session_state = CurrentSessionState()
         ctx = LinterContext(empty_index, session_state)
@@ -228,27 +258,46 @@ class DistInfo:
     def module_paths(self) -> list[Path]:
         files = []
         with Path(self._path, "RECORD").open(encoding=_DEFAULT_ENCODING) as f:
-            for line in f.readlines():
-                filename = line.split(',')[0]
+            for line in f:
+                filename, _, _ = line.partition(',')
                 if not filename.endswith(".py"):
                     continue
                 files.append(self._path.parent / filename)
         return files
 
     @cached_property
-    def _metadata(self) -> Message:
+    def _metadata(self) -> dict[str, list[str]]:
+        """The METADATA headers, keyed by lower-cased header name.
+
+        Only the header block is read: the long description that follows the first blank line is never needed.
+        """
+        headers: dict[str, list[str]] = collections.defaultdict(list)
+        last_header = ""
         with Path(self._path, "METADATA").open(encoding=_DEFAULT_ENCODING) as f:
-            return email.message_from_file(f)
+            for line in f:
+                line = line.rstrip('\r\n')
+                if not line:
+                    break
+                if line[0] in ' \t':
+                    if last_header:  # continuation of the previous header
+                        headers[last_header][-1] += line
+                    continue
+                key, sep, value = line.partition(':')
+                if not sep:
+                    continue
+                last_header = key.strip().lower()
+                headers[last_header].append(value.strip())
+        return headers
 
     @property
     def name(self) -> str:
-        name = self._metadata.get('Name', 'unknown')
-        return name.lower()
+        names = self._metadata.get('name', ['unknown'])
+        return names[0].lower()
 
     @property
     def library_names(self) -> list[str]:
         names = []
-        for requirement in self._metadata.get_all('Requires-Dist', []):
+        for requirement in self._metadata.get('requires-dist', []):
             library = self._extract_library_name_from_requires_dist(requirement)
             names.append(library)
         return names
@@ -110,7 +110,8 @@ class PathLookup:
         library_roots = []
         for library_root in [self._cwd] + self._sys_paths:
             try:
-                is_existing_directory = library_root.exists() and library_root.is_dir()
+                # is_dir() is False for paths that do not exist, which saves a stat per root on every resolution
+                is_existing_directory = library_root.is_dir()
             except PermissionError:
                 continue
             if is_existing_directory:
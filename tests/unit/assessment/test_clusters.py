@@ -1,3 +1,4 @@
+import base64
 import json
 from unittest.mock import MagicMock, create_autospec, mock_open, patch
 
@@ -5,7 +6,16 @@ import pytest
 from databricks.labs.lsql.backends import MockBackend
 from databricks.labs.lsql.core import Row
 from databricks.sdk.errors import DatabricksError, InternalError, NotFound
-from databricks.sdk.service.compute import ClusterDetails, Policy
+from databricks.sdk.service.compute import (
+    ClusterDetails,
+    ClusterPoliciesAPI,
+    ClusterSource,
+    DataSecurityMode,
+    DbfsStorageInfo,
+    InitScriptInfo,
+    Policy,
+)
+from databricks.sdk.service.files import ReadResponse
 
 from databricks.labs.ucx.__about__ import __version__ as ucx_version
 from databricks.labs.ucx.assessment.azure import AzureServicePrincipalCrawler
@@ -16,6 +26,7 @@ from databricks.labs.ucx.assessment.clusters import (
     ClusterInfo,
     ClusterPolicyOwnership,
     PolicyInfo,
+    PolicyRegistry,
 )
 from databricks.labs.ucx.framework.crawlers import SqlBackend
 from databricks.labs.ucx.framework.owners import AdministratorLocator
@@ -36,6 +47,17 @@ def test_cluster_assessment():
     assert result_set[1].success == 0
 
 
+def test_cluster_assessment_keeps_listing_order():
+    cluster_ids = ['no-isolation', 'simplest-autoscale', 'legacy-passthrough', 'passthrough', 'policy-azure-oauth']
+    ws = mock_workspace_client(cluster_ids=cluster_ids)
+    expected = [cluster.cluster_name for cluster in ws.clusters.list()]
+
+    crawler = ClustersCrawler(ws, MockBackend(), "ucx", batch_size=2)
+    result_set = list(crawler.snapshot())
+
+    assert [cluster.cluster_name for cluster in result_set] == expected
+
+
 def test_cluster_assessment_cluster_policy_not_found(caplog):
     ws = mock_workspace_client(cluster_ids=['policy-deleted'])
     crawler = ClustersCrawler(ws, MockBackend(), "ucx")
@@ -43,6 +65,18 @@ def test_cluster_assessment_cluster_policy_not_found(caplog):
     assert "The cluster policy was deleted: deleted" in caplog.messages
 
 
+def test_cluster_assessment_uses_listed_cluster_policies():
+    ws = mock_workspace_client(cluster_ids=['policy-single-user-with-spn', 'policy-azure-oauth', 'simplest-autoscale'])
+    cluster_policies = create_autospec(ClusterPoliciesAPI)
+    cluster_policies.list.return_value = [Policy(policy_id="single-user-with-spn"), Policy(policy_id="azure-oauth")]
+    ws.cluster_policies = cluster_policies
+    crawler = ClustersCrawler(ws, MockBackend(), "ucx")
+    result_set = list(crawler.snapshot())
+
+    assert len(result_set) == 3
+    cluster_policies.get.assert_not_called()
+
+
 def test_cluster_assessment_cluster_policy_exception():
     ws = mock_workspace_client(
         cluster_ids=['policy-azure-oauth'],
@@ -80,9 +114,44 @@ def test_cluster_init_script():
     assert len(init_crawler) == 1
 
 
+def test_cluster_init_script_dbfs_is_read_in_chunks():
+    ws = mock_workspace_client(cluster_ids=['init-scripts-dbfs'])
+    script = b"#!/bin/bash\nspark.hadoop.fs.azure.account.oauth2.client.id=abc\n"
+    ws.dbfs.read.side_effect = lambda _, *, offset, length: ReadResponse(
+        data=base64.b64encode(script[offset : offset + length]).decode("ascii")
+    )
+    result_set = list(ClustersCrawler(ws, MockBackend(), "ucx", dbfs_read_chunk_size=16).snapshot())
+
+    offsets = []
+    for call in ws.dbfs.read.call_args_list:
+        if call.args[0] == "/users/test@test.com/init_scripts/test.sh":
+            offsets.append(call.kwargs["offset"])
+    assert offsets == [0, 16, 32, 48]
+    assert "Uses azure service principal credentials config in cluster." in json.loads(result_set[0].failures)
+
+
+@pytest.mark.parametrize("early_exit,reads", [(True, 0), (False, 1)])
+def test_cluster_init_script_of_unsupported_cluster(early_exit: bool, reads: int) -> None:
+    ws = mock_workspace_client()
+    ws.clusters.list.return_value = [
+        ClusterDetails(
+            cluster_id="legacy",
+            spark_version="13.3.x-scala2.12",
+            data_security_mode=DataSecurityMode.LEGACY_PASSTHROUGH,
+            init_scripts=[InitScriptInfo(dbfs=DbfsStorageInfo(destination="dbfs:/init.sh"))],
+        )
+    ]
+    ws.dbfs.read.return_value = ReadResponse(data=base64.b64encode(b"echo").decode("ascii"))
+    crawler = ClustersCrawler(ws, MockBackend(), "ucx", early_exit=early_exit)
+    result_set = list(crawler.snapshot())
+
+    assert result_set[0].failures == '["cluster type not supported : LEGACY_PASSTHROUGH"]'
+    assert ws.dbfs.read.call_count == reads
+
+
 def test_cluster_file_init_script():
     ws = mock_workspace_client(cluster_ids=['init-scripts-file'])
-    with patch("builtins.open", mock_open(read_data="data")):
+    with patch("builtins.open", mock_open(read_data=b"data")):
         init_crawler = ClustersCrawler(ws, MockBackend(), "ucx").snapshot()
         assert len(init_crawler) == 1
 
@@ -144,6 +213,31 @@ def test_cluster_with_job_source():
     assert result_set[0].cluster_id == "0123-190044-1122334411"
 
 
+def test_cluster_snapshot_is_saved_in_a_single_batch():
+    ws = mock_workspace_client(cluster_ids=['no-isolation', 'simplest-autoscale', 'legacy-passthrough'])
+    sql_backend = create_autospec(SqlBackend)
+    sql_backend.fetch.return_value = []
+    crawler = ClustersCrawler(ws, sql_backend, "ucx")
+    result_set = list(crawler.snapshot())
+
+    sql_backend.save_table.assert_called_once_with(
+        "hive_metastore.ucx.clusters", result_set, ClusterInfo, mode="overwrite"
+    )
+
+
+def test_cluster_assessment_keeps_clusters_with_unknown_source():
+    ws = mock_workspace_client()
+    ws.clusters.list.return_value = [
+        ClusterDetails(cluster_id="job", spark_version="13.3.x-scala2.12", cluster_source=ClusterSource.JOB),
+        ClusterDetails(cluster_id="unknown", spark_version="13.3.x-scala2.12"),
+        ClusterDetails(cluster_id="ui", spark_version="13.3.x-scala2.12", cluster_source=ClusterSource.UI),
+    ]
+    crawler = ClustersCrawler(ws, MockBackend(), "ucx")
+    result_set = list(crawler.snapshot())
+
+    assert [cluster.cluster_id for cluster in result_set] == ["unknown", "ui"]
+
+
 def test_try_fetch():
     ws = mock_workspace_client(cluster_ids=['simplest-autoscale'])
     mock_backend = create_autospec(SqlBackend)
@@ -307,6 +401,36 @@ def test_policy_crawler_creator():
     assert set(expected_creators) == set(crawled_creators)
 
 
+def test_cluster_policies_are_listed_again_on_refresh():
+    ws = mock_workspace_client(cluster_ids=['policy-single-user-with-spn', 'policy-azure-oauth'])
+    cluster_policies = create_autospec(ClusterPoliciesAPI)
+    cluster_policies.list.return_value = [
+        Policy(policy_id="single-user-with-spn", definition="{}", name="foo"),
+        Policy(policy_id="azure-oauth", definition="{}", name="bar"),
+    ]
+    ws.cluster_policies = cluster_policies
+    crawler = ClustersCrawler(ws, MockBackend(), "ucx")
+
+    crawler.snapshot()
+    crawler.snapshot(force_refresh=True)
+
+    assert cluster_policies.list.call_count == 2
+    cluster_policies.get.assert_not_called()
+
+
+def test_policy_registry_fetches_policies_missing_from_the_listing():
+    ws = mock_workspace_client()
+    cluster_policies = create_autospec(ClusterPoliciesAPI)
+    cluster_policies.list.return_value = [Policy(policy_id="listed", definition="{}")]
+    cluster_policies.get.return_value = Policy(policy_id="unlisted", definition='{"spark_version": {}}')
+    ws.cluster_policies = cluster_policies
+    policies = PolicyRegistry(ws)
+
+    assert policies.get("unlisted") == (cluster_policies.get.return_value, {"spark_version": {}}, None)
+    assert policies.get("unlisted") is policies.get("unlisted")
+    cluster_policies.get.assert_called_once_with("unlisted")
+
+
 def test_policy_try_fetch():
     ws = mock_workspace_client(policy_ids=['single-user-with-spn-policyid'])
     mock_backend = MockBackend(
@@ -44,3 +44,37 @@ def test_local_context_attributes_not_none(attribute: str) -> None:
     ctx.replace(languages=LinterContext(TableMigrationIndex([])), tables_migrator=tables_migrator)
     assert hasattr(ctx, attribute)
     assert getattr(ctx, attribute) is not None
+
+
+def test_global_context_parses_pipeline_id_filters() -> None:
+    named_parameters = {"include_pipeline_ids": "a,b,c", "exclude_pipeline_ids": "b"}
+    ctx = GlobalContext(named_parameters).replace(workspace_client=mock_workspace_client(), sql_backend=MockBackend())
+
+    pipelines_migrator = ctx.pipelines_migrator
+
+    assert pipelines_migrator._include_pipeline_ids == ["a", "b", "c"]  # pylint: disable=protected-access
+    assert pipelines_migrator._exclude_pipeline_ids == ["b"]  # pylint: disable=protected-access
+    assert pipelines_migrator._get_pipeline_ids_to_migrate() == ["a", "c"]  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    "is_azure, is_aws, expected",
+    [(True, False, (True, False, False)), (False, True, (False, True, False)), (False, False, (False, False, True))],
+)
+def test_global_context_resolves_cloud(is_azure: bool, is_aws: bool, expected: tuple[bool, bool, bool]) -> None:
+    ws = mock_workspace_client()
+    ws.config.is_azure = is_azure
+    ws.config.is_aws = is_aws
+    ctx = GlobalContext().replace(workspace_client=ws)
+
+    assert (ctx.is_azure, ctx.is_aws, ctx.is_gcp) == expected
+
+
+def test_global_contexts_share_administrator_locator_of_workspace_client() -> None:
+    ws = mock_workspace_client()
+    first = GlobalContext().replace(workspace_client=ws)
+    second = GlobalContext().replace(workspace_client=ws)
+    other = GlobalContext().replace(workspace_client=mock_workspace_client())
+
+    assert first.administrator_locator is second.administrator_locator
+    assert first.administrator_locator is not other.administrator_locator
@@ -1,6 +1,7 @@
 import logging
 import re
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import create_autospec, Mock
 
 import pytest
@@ -394,3 +395,18 @@ def test_workspace_path_ownership_for_directory() -> None:
     assert owner == "cor"
     administrator_locator.get_workspace_administrator.assert_not_called()
     ws.permissions.get.assert_called_with("directories", "1")
+
+
+def test_admin_locator_locates_once_when_called_concurrently(ws) -> None:
+    """Verify that concurrent callers share a single search for an administrator."""
+    mock_finder = create_autospec(AdministratorFinder)
+    mock_finder.find_admin_users.return_value = (_create_account_admin("bob"),)
+    mock_finder_factory = Mock()
+    mock_finder_factory.return_value = mock_finder
+
+    locator = AdministratorLocator(ws, finders=[mock_finder_factory])
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        admins = list(executor.map(lambda _: locator.get_workspace_administrator(), range(32)))
+
+    assert set(admins) == {"bob"}
+    mock_finder.find_admin_users.assert_called_once()
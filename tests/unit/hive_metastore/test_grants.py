@@ -714,6 +714,28 @@ def test_migrate_grants_alters_ownership_as_last() -> None:
     group_manager.assert_not_called()
 
 
+def test_migrate_grants_only_applies_grants_of_source_object() -> None:
+    group_manager = create_autospec(GroupManager)
+    backend = MockBackend()
+    loaded = []
+
+    def grant_loader() -> list[Grant]:
+        loaded.append(True)
+        return [
+            Grant("user", "USAGE", "hive_metastore", "schema"),
+            Grant("user", "USAGE", "hive_metastore", "other"),
+        ]
+
+    migrate_grants = MigrateGrants(backend, group_manager, [grant_loader])
+
+    migrate_grants.apply(Schema("hive_metastore", "schema"), Schema("catalog", "schema"))
+    migrate_grants.apply(Schema("hive_metastore", "unknown"), Schema("catalog", "unknown"))
+
+    assert backend.queries == ["GRANT USE SCHEMA ON DATABASE `catalog`.`schema` TO `user`"]
+    assert len(loaded) == 1
+    group_manager.assert_not_called()
+
+
 def test_migrate_grants_logs_unmapped_acl(caplog) -> None:
     group_manager = create_autospec(GroupManager)
     table = Table("hive_metastore", "database", "table", "MANAGED", "DELTA")
@@ -1,13 +1,19 @@
+import time
 from collections.abc import Iterable
 from unittest.mock import create_autospec
 
 import pytest
+from databricks.labs.lsql.backends import MockBackend
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.errors import BadRequest, DatabricksError, NotFound
 from databricks.sdk.service.catalog import CatalogInfo, CatalogType, SchemaInfo, TableInfo
 
-from databricks.labs.ucx.hive_metastore.tables import TablesCrawler
-from databricks.labs.ucx.hive_metastore.table_migration_status import TableMigrationStatusRefresher
+from databricks.labs.ucx.hive_metastore.tables import Table, TablesCrawler
+from databricks.labs.ucx.hive_metastore.table_migration_status import (
+    TableMigrationIndex,
+    TableMigrationStatus,
+    TableMigrationStatusRefresher,
+)
 
 
 def test_table_migration_status_refresher_get_seen_tables_handles_errors_on_catalogs_list(mock_backend) -> None:
@@ -84,7 +90,8 @@ def test_table_migration_status_refresher_get_seen_tables_skips_system_catalog(m
             if schema.catalog_name == catalog_name:
                 yield schema
 
-    def tables_list(catalog_name: str, schema_name: str) -> Iterable[TableInfo]:
+    def tables_list(catalog_name: str, schema_name: str, omit_columns: bool | None = None) -> Iterable[TableInfo]:
+        assert omit_columns
         tables = [
             TableInfo(
                 full_name="test.test.test",
@@ -111,3 +118,103 @@ def test_table_migration_status_refresher_get_seen_tables_skips_system_catalog(m
     ws.schemas.list.assert_called_once_with(catalog_name="test")  # System is NOT called
     ws.tables.list.assert_called()
     tables_crawler.snapshot.assert_not_called()
+
+
+@pytest.mark.parametrize("schema, table", [("schema", "table"), ("Schema", "TABLE")])
+def test_table_migration_index_get_is_case_insensitive(schema: str, table: str) -> None:
+    status = TableMigrationStatus("Schema", "Table", "catalog", "schema", "table")
+    index = TableMigrationIndex([status])
+
+    assert index.get(schema, table) is status
+    assert index.is_migrated(schema, table)
+    assert not index.is_migrated("schema", "other")
+
+
+def test_table_migration_status_refresher_checks_only_seen_tables_for_migration() -> None:
+    ws = create_autospec(WorkspaceClient)
+    ws.catalogs.list.return_value = [CatalogInfo(name="catalog")]
+    ws.schemas.list.return_value = [SchemaInfo(catalog_name="catalog", name="schema")]
+    ws.tables.list.return_value = [
+        TableInfo(full_name="catalog.schema.migrated", properties={"upgraded_from": "hive_metastore.schema.migrated"}),
+        TableInfo(full_name="catalog.schema.unmarked", properties={"upgraded_from": "hive_metastore.schema.unmarked"}),
+    ]
+    tables_crawler = create_autospec(TablesCrawler)
+    tables_crawler.snapshot.return_value = [
+        Table("hive_metastore", "schema", "migrated", "MANAGED", "DELTA"),
+        Table("hive_metastore", "schema", "unmarked", "MANAGED", "DELTA"),
+        Table("hive_metastore", "schema", "unseen", "MANAGED", "DELTA"),
+    ]
+    properties = MockBackend.rows("key", "value")
+    backend = MockBackend(
+        rows={
+            "SHOW TBLPROPERTIES `schema`.`migrated`": properties[("upgraded_to", "catalog.schema.migrated")],
+            "SHOW TBLPROPERTIES `schema`.`unmarked`": properties[("upgraded_to", "does not have property")],
+        }
+    )
+
+    refresher = TableMigrationStatusRefresher(ws, backend, "test", tables_crawler)
+    index = refresher.index()
+
+    migrated = index.get("schema", "migrated")
+    assert migrated is not None
+    assert (migrated.dst_catalog, migrated.dst_schema, migrated.dst_table) == ("catalog", "schema", "migrated")
+    assert not index.is_migrated("schema", "unmarked")
+    assert not index.is_migrated("schema", "unseen")
+    assert not [query for query in backend.queries if "`unseen`" in query]
+    ws.tables.list.assert_called_once_with(catalog_name="catalog", schema_name="schema", omit_columns=True)
+
+
+def test_table_migration_status_refresher_get_seen_tables_merges_all_schemas(mock_backend) -> None:
+    ws = create_autospec(WorkspaceClient)
+    ws.catalogs.list.return_value = [CatalogInfo(name="catalog")]
+    schema_names = [f"schema{i}" for i in range(10)]
+    ws.schemas.list.return_value = [SchemaInfo(catalog_name="catalog", name=name) for name in schema_names]
+
+    def tables_list(catalog_name: str, schema_name: str, omit_columns: bool | None = None) -> Iterable[TableInfo]:
+        assert omit_columns
+        yield TableInfo(
+            full_name=f"{catalog_name}.{schema_name}.Table",
+            properties={"upgraded_from": f"hive_metastore.{schema_name}.Table"},
+        )
+
+    ws.tables.list.side_effect = tables_list
+    tables_crawler = create_autospec(TablesCrawler)
+    refresher = TableMigrationStatusRefresher(ws, mock_backend, "test", tables_crawler)
+
+    seen_tables = refresher.get_seen_tables()
+
+    assert seen_tables == {f"catalog.{name}.table": f"hive_metastore.{name}.table" for name in schema_names}
+    tables_crawler.snapshot.assert_not_called()
+
+
+def test_table_migration_status_refresher_prefers_last_listed_schema_when_listings_complete_out_of_order() -> None:
+    ws = create_autospec(WorkspaceClient)
+    ws.catalogs.list.return_value = [CatalogInfo(name="catalog")]
+    ws.schemas.list.return_value = [
+        SchemaInfo(catalog_name="catalog", name="old"),
+        SchemaInfo(catalog_name="catalog", name="new"),
+    ]
+
+    def tables_list(catalog_name: str, schema_name: str, omit_columns: bool | None = None) -> Iterable[TableInfo]:
+        assert omit_columns
+        if schema_name == "old":
+            time.sleep(0.1)  # the listing of the first schema completes last
+        properties = {"upgraded_from": "hive_metastore.schema.table"}
+        return [TableInfo(full_name=f"{catalog_name}.{schema_name}.table", properties=properties)]
+
+    ws.tables.list.side_effect = tables_list
+    tables_crawler = create_autospec(TablesCrawler)
+    tables_crawler.snapshot.return_value = [Table("hive_metastore", "schema", "table", "MANAGED", "DELTA")]
+    properties = MockBackend.rows("key", "value")
+    backend = MockBackend(
+        rows={"SHOW TBLPROPERTIES `schema`.`table`": properties[("upgraded_to", "catalog.new.table")]}
+    )
+    refresher = TableMigrationStatusRefresher(ws, backend, "test", tables_crawler)
+
+    seen_tables = refresher.get_seen_tables()
+    index = refresher.index()
+
+    assert list(seen_tables) == ["catalog.old.table", "catalog.new.table"]
+    migrated = index.get("schema", "table")
+    assert migrated is not None
+    assert migrated.destination() == "catalog.new.table"
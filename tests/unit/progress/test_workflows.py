@@ -1,40 +1,40 @@
 import datetime as dt
-from typing import get_type_hints
+from types import SimpleNamespace
 from unittest.mock import create_autospec
 
 import pytest
+from databricks.labs.ucx.assessment.clusters import ClustersCrawler, PoliciesCrawler
+from databricks.labs.ucx.assessment.jobs import JobsCrawler
+from databricks.labs.ucx.assessment.pipelines import PipelinesCrawler
 from databricks.labs.ucx.hive_metastore import TablesCrawler
+from databricks.labs.ucx.hive_metastore.grants import GrantsCrawler
 from databricks.labs.ucx.hive_metastore.table_migration_status import TableMigrationStatusRefresher
+from databricks.labs.ucx.hive_metastore.udfs import UdfsCrawler
+from databricks.labs.ucx.progress import workflow_runs
 from databricks.labs.ucx.progress.history import ProgressEncoder
+from databricks.labs.ucx.source_code.linters.jobs import WorkflowLinter
+from databricks.labs.ucx.source_code.linters.queries import QueryLinter
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.catalog import CatalogInfo, MetastoreAssignment
 from databricks.sdk.service.jobs import BaseRun, RunResultState, RunState, PauseStatus
 
 from databricks.labs.ucx.progress.workflows import MigrationProgress
-from databricks.labs.ucx.contexts.workflow_task import RuntimeContext
 
 
 @pytest.mark.parametrize(
-    "task, crawler, history_log",
+    "task, crawler_class, crawler_name, history_log_name",
     (
-        (MigrationProgress.crawl_udfs, RuntimeContext.udfs_crawler, RuntimeContext.udfs_progress),
-        (MigrationProgress.crawl_grants, RuntimeContext.grants_crawler, RuntimeContext.grants_progress),
-        (MigrationProgress.assess_jobs, RuntimeContext.jobs_crawler, RuntimeContext.jobs_progress),
-        (MigrationProgress.assess_clusters, RuntimeContext.clusters_crawler, RuntimeContext.clusters_progress),
-        (MigrationProgress.assess_pipelines, RuntimeContext.pipelines_crawler, RuntimeContext.pipelines_progress),
-        (
-            MigrationProgress.crawl_cluster_policies,
-            RuntimeContext.policies_crawler,
-            RuntimeContext.policies_progress,
-        ),
+        (MigrationProgress.crawl_udfs, UdfsCrawler, "udfs_crawler", "udfs_progress"),
+        (MigrationProgress.crawl_grants, GrantsCrawler, "grants_crawler", "grants_progress"),
+        (MigrationProgress.assess_jobs, JobsCrawler, "jobs_crawler", "jobs_progress"),
+        (MigrationProgress.assess_clusters, ClustersCrawler, "clusters_crawler", "clusters_progress"),
+        (MigrationProgress.assess_pipelines, PipelinesCrawler, "pipelines_crawler", "pipelines_progress"),
+        (MigrationProgress.crawl_cluster_policies, PoliciesCrawler, "policies_crawler", "policies_progress"),
     ),
 )
-def test_migration_progress_runtime_refresh(run_workflow, task, crawler, history_log) -> None:
-    crawler_class = get_type_hints(crawler.func)["return"]
-    mock_crawler = create_autospec(crawler_class)
-    mock_history_log = create_autospec(ProgressEncoder)
-    crawler_name = crawler.attrname
-    history_log_name = history_log.attrname
+def test_migration_progress_runtime_refresh(run_workflow, task, crawler_class, crawler_name, history_log_name) -> None:
+    mock_crawler = create_autospec(crawler_class, instance=True)
+    mock_history_log = create_autospec(ProgressEncoder, instance=True)
     context_replacements = {
         crawler_name: mock_crawler,
         history_log_name: mock_history_log,
@@ -45,76 +45,72 @@ def test_migration_progress_runtime_refresh(run_workflow, task, crawler, history
     mock_history_log.append_inventory_snapshot.assert_called_once()
 
 
-def test_migration_progress_runtime_tables_refresh_crawl_tables(run_workflow) -> None:
-    """Ensure that step 1 of the split crawl/update-history-log tasks performs its part of the refresh process."""
-    mock_tables_crawler = create_autospec(TablesCrawler)
-    mock_history_log = create_autospec(ProgressEncoder)
+@pytest.mark.parametrize(
+    "task, crawler_name, crawler_class",
+    (
+        # The first part of a 3-step update: the table crawl without updating the history log.
+        (MigrationProgress.crawl_tables, "tables_crawler", TablesCrawler),
+        # The second part of a 3-step update: updating table migration status without updating the history log.
+        (MigrationProgress.refresh_table_migration_status, "migration_status_refresher", TableMigrationStatusRefresher),
+    ),
+)
+def test_migration_progress_runtime_tables_refresh(run_workflow, task, crawler_name, crawler_class) -> None:
+    """Ensure that the split crawl tasks refresh their snapshot without updating the history log."""
+    mock_crawler = create_autospec(crawler_class, instance=True)
+    mock_history_log = create_autospec(ProgressEncoder, instance=True)
     context_replacements = {
-        "tables_crawler": mock_tables_crawler,
+        crawler_name: mock_crawler,
         "tables_progress": mock_history_log,
         "named_parameters": {"parent_run_id": 53},
     }
 
-    # The first part of a 3-step update: the table crawl without updating the history log.
-    run_workflow(MigrationProgress.crawl_tables, **context_replacements)
-    mock_tables_crawler.snapshot.assert_called_once_with(force_refresh=True)
-    mock_history_log.append_inventory_snapshot.assert_not_called()
-
-
-def test_migration_progress_runtime_tables_refresh_migration_status(run_workflow) -> None:
-    """Ensure that step 2 of the split crawl/update-history-log tasks performs its part of the refresh process."""
-    mock_migration_status_refresher = create_autospec(TableMigrationStatusRefresher)
-    mock_history_log = create_autospec(ProgressEncoder)
-    context_replacements = {
-        "migration_status_refresher": mock_migration_status_refresher,
-        "tables_progress": mock_history_log,
-        "named_parameters": {"parent_run_id": 53},
-    }
+    run_workflow(task, **context_replacements)
 
-    # The second part of a 3-step update: updating table migration status without updating the history log.
-    task_dependencies = getattr(MigrationProgress.refresh_table_migration_status, "__task__").depends_on
-    assert MigrationProgress.crawl_tables.__name__ in task_dependencies
-    run_workflow(MigrationProgress.refresh_table_migration_status, **context_replacements)
-    mock_migration_status_refresher.snapshot.assert_called_once_with(force_refresh=True)
+    mock_crawler.snapshot.assert_called_once_with(force_refresh=True)
     mock_history_log.append_inventory_snapshot.assert_not_called()
 
 
 def test_migration_progress_runtime_tables_refresh_update_history_log(run_workflow) -> None:
-    """Ensure that the split crawl and update-history-log tasks perform their part of the refresh process."""
-    mock_tables_crawler = create_autospec(TablesCrawler)
-    mock_history_log = create_autospec(ProgressEncoder)
+    """Ensure that the final part of the 3-step update updates the history log (without a forced crawl)."""
+    mock_tables_crawler = create_autospec(TablesCrawler, instance=True)
+    mock_history_log = create_autospec(ProgressEncoder, instance=True)
     context_replacements = {
         "tables_crawler": mock_tables_crawler,
         "tables_progress": mock_history_log,
         "named_parameters": {"parent_run_id": 53},
     }
 
-    # The final part of the 3-step update: updating the history log (without a forced crawl).
-    task_dependencies = getattr(MigrationProgress.update_tables_history_log, "__task__").depends_on
-    assert MigrationProgress.crawl_tables.__name__ in task_dependencies
-    assert MigrationProgress.refresh_table_migration_status.__name__ in task_dependencies
     run_workflow(MigrationProgress.update_tables_history_log, **context_replacements)
+
     mock_tables_crawler.snapshot.assert_called_once_with()
     mock_history_log.append_inventory_snapshot.assert_called_once()
 
 
+def test_migration_progress_runtime_tables_refresh_task_order() -> None:
+    """Ensure that the split crawl/update-history-log tasks run in order."""
+    task_dependencies = getattr(MigrationProgress.refresh_table_migration_status, "__task__").depends_on
+    assert MigrationProgress.crawl_tables.__name__ in task_dependencies
+
+    task_dependencies = getattr(MigrationProgress.update_tables_history_log, "__task__").depends_on
+    assert MigrationProgress.crawl_tables.__name__ in task_dependencies
+    assert MigrationProgress.refresh_table_migration_status.__name__ in task_dependencies
+
+
 @pytest.mark.parametrize(
-    "task, linter",
+    "task, linter_class, linter_name",
     (
-        (MigrationProgress.assess_dashboards, RuntimeContext.query_linter),
-        (MigrationProgress.assess_workflows, RuntimeContext.workflow_linter),
+        (MigrationProgress.assess_dashboards, QueryLinter, "query_linter"),
+        (MigrationProgress.assess_workflows, WorkflowLinter, "workflow_linter"),
     ),
 )
-def test_linter_runtime_refresh(run_workflow, task, linter) -> None:
-    linter_class = get_type_hints(linter.func)["return"]
-    mock_linter = create_autospec(linter_class)
-    linter_name = linter.attrname
+def test_linter_runtime_refresh(run_workflow, task, linter_class, linter_name) -> None:
+    mock_linter = create_autospec(linter_class, instance=True)
     run_workflow(task, **{linter_name: mock_linter})
     mock_linter.refresh_report.assert_called_once()
 
 
 def test_migration_progress_with_valid_prerequisites(run_workflow) -> None:
-    ws = create_autospec(WorkspaceClient)
+    ws = create_autospec(WorkspaceClient, instance=True)
     ws.metastores.current.return_value = MetastoreAssignment(metastore_id="test", workspace_id=123456789)
     ws.catalogs.get.return_value = CatalogInfo()
     ws.jobs.list_runs.return_value = [BaseRun(state=RunState(result_state=RunResultState.SUCCESS))]
@@ -129,17 +125,25 @@ def test_migration_progress_with_valid_prerequisites(run_workflow) -> None:
 
 def test_migration_progress_with_invalid_prerequisites(run_workflow) -> None:
     """All invalid prerequisites permutations are tested for `VerifyProgressTracking` separately."""
-    ws = create_autospec(WorkspaceClient)
+    ws = create_autospec(WorkspaceClient, instance=True)
     ws.metastores.current.return_value = None
     task = MigrationProgress.verify_prerequisites
     with pytest.raises(RuntimeWarning, match="Metastore not attached to workspace."):
         run_workflow(task, workspace_client=ws)
 
 
-def test_migration_progress_record_workflow_run(run_workflow, mock_backend) -> None:
+def test_migration_progress_record_workflow_run(run_workflow, mock_backend, monkeypatch) -> None:
     """Verify that we log the workflow run."""
     task = MigrationProgress.record_workflow_run
-    start_time = dt.datetime.now(dt.timezone.utc).replace(microsecond=0)
+    start_time = dt.datetime(2024, 10, 18, 16, 34, tzinfo=dt.timezone.utc)
+    finish_time = dt.datetime(2024, 10, 18, 16, 49, tzinfo=dt.timezone.utc)
+
+    class FrozenDateTime(dt.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return finish_time
+
+    monkeypatch.setattr(workflow_runs, "dt", SimpleNamespace(datetime=FrozenDateTime, timezone=dt.timezone))
     context_replacements = {
         "sql_backend": mock_backend,
         "named_parameters": {
@@ -155,11 +159,11 @@ def test_migration_progress_record_workflow_run(run_workflow, mock_backend) -> N
 
     rows = mock_backend.rows_written_for("ucx.multiworkspace.workflow_runs", "append")
 
-    rows_as_dict = [{k: v for k, v in rows.asDict().items() if k != 'finished_at'} for rows in rows]
+    rows_as_dict = [row.asDict() for row in rows]
     assert rows_as_dict == [
         {
             "started_at": start_time,
-            # finished_at: checked below.
+            "finished_at": finish_time,
             "workspace_id": 123,
             "workflow_name": "test",
             "workflow_id": 123456,
@@ -167,8 +171,6 @@ def test_migration_progress_record_workflow_run(run_workflow, mock_backend) -> N
             "workflow_run_attempt": 0,
         }
     ]
-    # Finish-time must be indistinguishable from or later than the start time.
-    assert all(row["started_at"] <= row["finished_at"] for row in rows)
 
 
 def test_migration_progress_has_schedule() -> None:
@@ -1,3 +1,4 @@
+import json
 import logging
 from pathlib import Path
 from typing import cast
@@ -9,7 +10,7 @@ import pytest
 from databricks.labs.ucx.source_code.base import CurrentSessionState
 from databricks.labs.ucx.source_code.graph import DependencyGraph
 
-from databricks.labs.ucx.source_code.known import KnownList, KnownDependency, KnownLoader, KnownProblem
+from databricks.labs.ucx.source_code.known import DistInfo, KnownList, KnownDependency, KnownLoader, KnownProblem
 from databricks.labs.ucx.source_code.path_lookup import PathLookup
 
 
@@ -65,6 +66,34 @@ def test_unknown_compatibility(library: str) -> None:
     assert not compatibility.known
 
 
+def test_module_compatibility_prefers_most_specific_module() -> None:
+    known_json = {
+        "parent": {"parent": []},
+        "child": {"parent.child": [{"code": "child-problem", "message": "child"}]},
+    }
+    with mock.patch.object(KnownList, "_get_known", return_value=known_json):
+        known = KnownList()
+
+    child = known.module_compatibility("parent.child.module")
+    assert child.known
+    assert child.problems == [KnownProblem("child-problem", "child")]
+
+    sibling = known.module_compatibility("parent.sibling")
+    assert sibling.known
+    assert not sibling.problems
+
+    assert not known.module_compatibility("parentless").known
+
+
+def test_module_compatibility_is_cached() -> None:
+    known = KnownList()
+
+    first = known.module_compatibility("databricks.sdk.service.compute")
+    second = known.module_compatibility("databricks.sdk.service.compute")
+
+    assert first is second
+
+
 def test_loads_known_json() -> None:
     known_json = KnownList._get_known()  # pylint: disable=protected-access
     assert known_json is not None and len(known_json) > 0
@@ -101,6 +130,47 @@ def test_analyze_dist_info() -> None:
     TestKnownList.analyze_cachetools_dist_info()
 
 
+def test_known_list_rebuild_analyzes_distributions_in_parallel_as_sequentially(tmp_path) -> None:
+    dist_info_folders = []
+    for name in ("alpha", "beta", "gamma"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "__init__.py").write_text('spark.read.csv("/dbfs/mnt/data")\n', encoding="utf-8")
+        (tmp_path / name / "core.py").write_text("sc.parallelize([1])\n", encoding="utf-8")
+        dist_info_folder = tmp_path / f"{name}-1.0.dist-info"
+        dist_info_folder.mkdir()
+        (dist_info_folder / "METADATA").write_text(f"Name: {name}\n", encoding="utf-8")
+        (dist_info_folder / "RECORD").write_text(f"{name}/__init__.py,,\n{name}/core.py,,\n", encoding="utf-8")
+        dist_info_folders.append((dist_info_folder, tmp_path))
+    sequential: dict[str, dict] = {}
+    for dist_info_folder, library_root in dist_info_folders:
+        KnownList._analyze_dist_info(dist_info_folder, sequential, library_root)  # pylint: disable=protected-access
+
+    parallel = KnownList._analyze_new_dist_infos(dist_info_folders)  # pylint: disable=protected-access
+
+    assert json.dumps(parallel, indent=2) == json.dumps(sequential, indent=2)
+    assert any(problems for modules in parallel.values() for problems in modules.values())
+
+
+def test_dist_info_reads_metadata_headers(tmp_path) -> None:
+    dist_info_folder = tmp_path / "demo-1.0.dist-info"
+    dist_info_folder.mkdir()
+    metadata = """Metadata-Version: 2.1
+Name: Demo
+Summary: A package
+  spanning lines
+Requires-Dist: requests>=2.0
+Requires-Dist: numpy ; extra == "np"
+
+Requires-Dist: not-a-header
+"""
+    (dist_info_folder / "METADATA").write_text(metadata, encoding="utf-8")
+
+    dist_info = DistInfo(dist_info_folder)
+
+    assert dist_info.name == "demo"
+    assert dist_info.library_names == ["requests", "numpy"]
+
+
 @pytest.mark.parametrize("problems", [[], [KnownProblem("test", "test")]])
 def test_known_loader_loads_known_container_without_problems(
     simple_dependency_resolver, problems: list[KnownProblem]